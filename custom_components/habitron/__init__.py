@@ -8,7 +8,7 @@ from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.device_registry import DeviceEntry
 
-from .communicate import TimeoutException
+from .communicate import TimeoutException, async_get_host_ip
 from .const import (
     DOMAIN,
     EVNT_ARG1,
@@ -146,7 +146,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 break
 
     try:
-        smhub = SmartHub(hass, entry)
+        host = await async_get_host_ip(entry.data["habitron_host"])
+        smhub = SmartHub(hass, entry, host)
         hass.data.setdefault(DOMAIN, {})[entry.entry_id] = smhub
         await smhub.async_setup()
     except (TimeoutError, TimeoutException) as ex:
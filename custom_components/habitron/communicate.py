@@ -75,12 +75,12 @@ SMHUB_COMMANDS: Final[dict[str, str]] = {
 class HbtnComm:
     """Habitron communication class."""
 
-    def __init__(self, hass: HomeAssistant, config: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, config: ConfigEntry, host: str) -> None:
         """Init CommTest for connection test."""
         self._name: str = "HbtnComm"
         self._host_conf: str = config.data.__getitem__("habitron_host")
         self.logger = logging.getLogger(__name__)
-        self._host: str = get_host_ip(self._host_conf)
+        self._host: str = host
         self.logger.info(f"Initializing hub, got own ip: {self._host}")  # noqa: G004
         self._port: int = 7777
 
@@ -136,7 +136,6 @@ class HbtnComm:
         if self._host_conf == host:
             return
         self._host_conf = host
-        self._host = get_host_ip(self._host_conf)
         await self._hass.config_entries.async_reload(self._config.entry_id)
 
     async def send_network_info(self, tok: str):
@@ -784,7 +783,7 @@ async def test_connection(host_name) -> tuple[bool, str]:
     """Test connectivity to SmartHub is OK."""
     port = 7777
     try:
-        host = get_host_ip(host_name)
+        host = await async_get_host_ip(host_name)
     except socket.gaierror as exc:
         raise socket.gaierror from exc
     sck = socket.socket()  # Create a socket object
@@ -808,10 +807,12 @@ async def test_connection(host_name) -> tuple[bool, str]:
     return conn_ok, host_name
 
 
-def get_host_ip(host_name: str) -> str:
-    """Get IP from DNS host name, error handling."""
-    host = socket.gethostbyname(host_name)
-    return host
+async def async_get_host_ip(host_name: str) -> str:
+    """Get IP from DNS host name without blocking the event loop."""
+    infos = await asyncio.get_running_loop().getaddrinfo(
+        host_name, None, family=socket.AF_INET
+    )
+    return infos[0][4][0]
 
 
 def send_receive(sck, cmd_str: str) -> bytes:
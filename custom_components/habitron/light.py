@@ -36,34 +36,16 @@ async def async_setup_entry(
 
     new_devices = []
     for hbt_module in hbtn_rt.modules:
+        # 1: standard, 2: dimmer, other type numbers disable output
+        if hbt_module.comm.is_smhub:
+            out_classes = {1: SwitchedOutputPush, 2: DimmedOutputPush}
+        else:
+            out_classes = {1: SwitchedOutput, 2: DimmedOutput}
         for mod_output in hbt_module.outputs:
-            # other type numbers disable output
-            if abs(mod_output.type) == 1:  # standard
-                if hbt_module.comm.is_smhub:
-                    new_devices.append(
-                        SwitchedOutputPush(
-                            mod_output, hbt_module, hbtn_cord, len(new_devices)
-                        )
-                    )
-                else:
-                    new_devices.append(
-                        SwitchedOutput(
-                            mod_output, hbt_module, hbtn_cord, len(new_devices)
-                        )
-                    )
-            if abs(mod_output.type) == 2:  # dimmer
-                if hbt_module.comm.is_smhub:
-                    new_devices.append(
-                        DimmedOutputPush(
-                            mod_output, hbt_module, hbtn_cord, len(new_devices)
-                        )
-                    )
-                else:
-                    new_devices.append(
-                        DimmedOutput(
-                            mod_output, hbt_module, hbtn_cord, len(new_devices)
-                        )
-                    )
+            if out_class := out_classes.get(abs(mod_output.type)):
+                new_devices.append(
+                    out_class(mod_output, hbt_module, hbtn_cord, len(new_devices))
+                )
         for mod_led in hbt_module.leds:
             if isinstance(mod_led, CLedDescriptor):
                 led_name = "RGB LED"
@@ -100,6 +82,8 @@ class SwitchedOutput(CoordinatorEntity, LightEntity):
         self.idx: int = idx
         self._output: IfDescriptor = output
         self._module: HbtnModule = module
+        self._mod_addr: int = module.mod_addr
+        self._set_output = module.comm.async_set_output
         if output.name.strip() == "":
             self._attr_name = f"Out {output.nmbr + 1}"
         else:
@@ -107,6 +91,7 @@ class SwitchedOutput(CoordinatorEntity, LightEntity):
         self._nmbr: int = output.nmbr
         self._brightness: int = 255
         self._out_offs = 0  # Dimm 1 = Out 1 + offs
+        self._last_state: tuple | None = None  # last written to HA
         self._attr_unique_id: str = f"{self._module.uid}_out_{output.nmbr}"
         if output.type < 0:
             # Entity will not show up
@@ -140,19 +125,19 @@ class SwitchedOutput(CoordinatorEntity, LightEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self._attr_is_on = self._output.value == 1
+        state = (self._attr_is_on, self.coordinator.last_update_success)
+        if state == self._last_state:
+            return  # nothing changed, skip state write
+        self._last_state = state
         self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Instruct the light to turn on."""
-        await self._module.comm.async_set_output(
-            self._module.mod_addr, self._nmbr + 1, 1
-        )
+        await self._set_output(self._mod_addr, self._nmbr + 1, 1)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Instruct the light to turn off."""
-        await self._module.comm.async_set_output(
-            self._module.mod_addr, self._nmbr + 1, 0
-        )
+        await self._set_output(self._mod_addr, self._nmbr + 1, 0)
 
 
 class DimmedOutput(SwitchedOutput):
@@ -165,6 +150,8 @@ class DimmedOutput(SwitchedOutput):
         super().__init__(output, module, coord, idx)
         if module.mod_type[:18] == "Smart Controller X":
             self._out_offs = 10  # Dimm 1 = Out 11
+        self._dimmer: IfDescriptor = module.dimmers[self._nmbr - self._out_offs]
+        self._set_dimmval = module.comm.async_set_dimmval
 
     @property
     def brightness(self) -> int:
@@ -187,9 +174,16 @@ class DimmedOutput(SwitchedOutput):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self._attr_is_on = self._output.value == 1
-        self._brightness = int(
-            self._module.dimmers[self._nmbr - self._out_offs].value * 2.55
+        # integer rounding of 0..100 % to 0..255
+        self._brightness = (self._dimmer.value * 255 + 50) // 100
+        state = (
+            self._attr_is_on,
+            self._brightness,
+            self.coordinator.last_update_success,
         )
+        if state == self._last_state:
+            return  # nothing changed, skip state write
+        self._last_state = state
         self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -198,10 +192,10 @@ class DimmedOutput(SwitchedOutput):
         #     self._module.mod_addr, self._nmbr + 1, 1
         # )
         self._brightness = kwargs.get(ATTR_BRIGHTNESS, self._brightness)
-        await self._module.comm.async_set_dimmval(
-            self._module.mod_addr,
+        await self._set_dimmval(
+            self._mod_addr,
             self._nmbr - self._out_offs + 1,
-            round(self._brightness * 100.0 / 255),
+            (self._brightness * 100 + 127) // 255,
         )
 
 
@@ -217,12 +211,12 @@ class SwitchedOutputPush(SwitchedOutput):
         # The call back registration is done once this entity is registered with HA
         # (rather than in the __init__)
         await super().async_added_to_hass()
-        self._output.register_callback(self.async_write_ha_state)
+        self._output.register_callback(self._handle_coordinator_update)
 
     async def async_will_remove_from_hass(self) -> None:
         """Entity being removed from hass."""
         # The opposite of async_added_to_hass. Remove any registered call backs here.
-        self._output.remove_callback(self.async_write_ha_state)
+        self._output.remove_callback(self._handle_coordinator_update)
 
 
 class DimmedOutputPush(SwitchedOutputPush):
@@ -235,6 +229,8 @@ class DimmedOutputPush(SwitchedOutputPush):
         super().__init__(output, module, coord, idx)
         if module.mod_type[:18] == "Smart Controller X":
             self._out_offs = 10  # Dimm 1 = Out 11
+        self._dimmer: IfDescriptor = module.dimmers[self._nmbr - self._out_offs]
+        self._set_dimmval = module.comm.async_set_dimmval
 
     @property
     def brightness(self) -> int:
@@ -257,9 +253,16 @@ class DimmedOutputPush(SwitchedOutputPush):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self._attr_is_on = self._output.value == 1
-        self._brightness = int(
-            self._module.dimmers[self._nmbr - self._out_offs].value * 2.55
+        # integer rounding of 0..100 % to 0..255
+        self._brightness = (self._dimmer.value * 255 + 50) // 100
+        state = (
+            self._attr_is_on,
+            self._brightness,
+            self.coordinator.last_update_success,
         )
+        if state == self._last_state:
+            return  # nothing changed, skip state write
+        self._last_state = state
         self.async_write_ha_state()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -268,10 +271,10 @@ class DimmedOutputPush(SwitchedOutputPush):
         #     self._module.mod_addr, self._nmbr + 1, 1
         # )
         self._brightness = kwargs.get(ATTR_BRIGHTNESS, self._brightness)
-        await self._module.comm.async_set_dimmval(
-            self._module.mod_addr,
+        await self._set_dimmval(
+            self._mod_addr,
             self._nmbr - self._out_offs + 1,
-            int(self._brightness * 100.0 / 255),
+            (self._brightness * 100 + 127) // 255,
         )
 
 
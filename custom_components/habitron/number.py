@@ -56,10 +56,13 @@ class HbtnNumber(CoordinatorEntity, NumberEntity):
         self.idx = idx
         self._setval = setval
         self._module = module
+        self._mod_addr = module.mod_addr
+        self._set_setpoint = module.comm.async_set_setpoint
         self._nmbr = setval.nmbr
         self._attr_name = setval.name
         self._attr_unique_id = f"{self._module.uid}_number_{48+setval.nmbr}"
         self._attr_native_value = setval.value
+        self._last_state: tuple | None = None  # last written to HA
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -75,14 +78,18 @@ class HbtnNumber(CoordinatorEntity, NumberEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self._attr_native_value = self._setval.value
+        state = (self._attr_native_value, self.coordinator.last_update_success)
+        if state == self._last_state:
+            return  # nothing changed, skip state write
+        self._last_state = state
         self.async_write_ha_state()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the new value."""
         self._attr_native_value = value
         int_val = int(self._attr_native_value * 10)
-        await self._module.comm.async_set_setpoint(
-            self._module.mod_addr,
+        await self._set_setpoint(
+            self._mod_addr,
             self._setval.nmbr + 1,
             int_val,
         )
@@ -29,12 +29,12 @@ class SmartHub:
 
     manufacturer = "Habitron GmbH"
 
-    def __init__(self, hass: HomeAssistant, config: ConfigEntry) -> None:
+    def __init__(self, hass: HomeAssistant, config: ConfigEntry, host: str) -> None:
         """Init SmartHub."""
         self.hass: HomeAssistant = hass
         self.config: ConfigEntry = config
         self._name: str = config.title
-        self.comm = hbtn_com(hass, config)
+        self.comm = hbtn_com(hass, config, host)
         self.online: bool = True
         self._mac: str = self.comm.com_mac
         self.uid: str = self._mac.replace(":", "")